@@ -1,31 +1,50 @@
 """MitreAttackData Library."""
 
+from collections import defaultdict
 from itertools import chain
+from typing import Iterable, NamedTuple
 
 import stix2
 from dateutil import parser
 from stix2 import Filter
+from stix2.datastore.filters import apply_common_filters
 from stix2.utils import get_type_from_id
 
 from mitreattack.stix20.custom_attack_objects import StixObjectFactory
 
 
+class _RelatedRefs(NamedTuple):
+    """Related objects of an object, as parallel lists of related object IDs and relationships."""
+
+    ids: list
+    relationships: list
+
+
 class MitreAttackData:
     """MitreAttackData object."""
 
-    stix_types = [
-        "attack-pattern",
-        "malware",
-        "tool",
-        "intrusion-set",
-        "campaign",
-        "course-of-action",
-        "x-mitre-matrix",
-        "x-mitre-tactic",
-        "x-mitre-data-source",
-        "x-mitre-data-component",
-        "x-mitre-asset",
-    ]
+    stix_types = frozenset(
+        [
+            "attack-pattern",
+            "malware",
+            "tool",
+            "intrusion-set",
+            "campaign",
+            "course-of-action",
+            "x-mitre-matrix",
+            "x-mitre-tactic",
+            "x-mitre-data-source",
+            "x-mitre-data-component",
+            "x-mitre-asset",
+        ]
+    )
+
+    # kill_chain_name of the techniques of each domain
+    domain_to_kill_chain = {
+        "enterprise-attack": "mitre-attack",
+        "mobile-attack": "mitre-mobile-attack",
+        "ics-attack": "mitre-ics-attack",
+    }
 
     # software:group
     all_software_used_by_all_groups = None
@@ -58,6 +77,8 @@ class MitreAttackData:
     all_techniques_targeting_all_assets = None
     all_assets_targeted_by_all_techniques = None
 
+    all_revoking_objects = None
+
     def __init__(self, stix_filepath: str = None, src: stix2.MemoryStore = None):
         """Initialize a MitreAttackData object.
 
@@ -67,6 +88,8 @@ class MitreAttackData:
             Filepath to a STIX 2.0 bundle. Mutually exclusive with `src`.
         src : stix2.MemoryStore, optional
             A STIX 2.0 bundle that has already been loaded into memory. Mutually exclusive with `stix_file`.
+            The store is indexed once when the object is built, so objects added to it afterwards are not
+            visible to lookups; build a new MitreAttackData to include them.
         """
         if not stix_filepath and not src:
             raise TypeError("MitreAttackData cannot be initialized without one of `stix_filepath` or `src`.")
@@ -78,6 +101,14 @@ class MitreAttackData:
 
         self.stix_filepath = None
         self.src = None
+        # stix_id => (object from the data source, object built from it by StixObjectFactory)
+        self._stix_objects = {}
+        # (source_type, relationship_type, target_type) => (forward mapping, reverse mapping)
+        self._relationship_maps = {}
+        # (source_type, relationship_type, target_type, reverse) => mapping built by get_related()
+        self._related_cache = {}
+        # stix_type => {stix_id => object} for objects that are neither revoked nor deprecated
+        self._active_objects = {}
 
         if stix_filepath:
             self.stix_filepath = stix_filepath
@@ -86,6 +117,8 @@ class MitreAttackData:
         elif src:
             self.src = src
 
+        self._build_indexes()
+
     ###################################
     # Utilities
     ###################################
@@ -102,6 +135,184 @@ class MitreAttackData:
         """
         print(object.serialize(pretty))
 
+    # The lookups in this class are dictionary and attribute accesses over untyped STIX objects, not numeric
+    # loops, so JIT compilers such as Numba cannot compile them. They are made fast by indexing the data once,
+    # below, and by caching the relationship mappings built from it. The same holds for the campaign fanout in
+    # add_inherited_campaign_relationships(): integer-encoding the IDs would only move the join, since its
+    # output is a list of new {"object", "relationships"} dictionaries per object, built once and memoized.
+    # Building independent mappings in a thread pool does not help for the same reason: the MemoryStore and
+    # the indexes are plain Python objects, so the builds hold the GIL and would only run interleaved.
+    def _build_indexes(self):
+        """Build lookup tables over the data source so that lookups do not need to scan it.
+
+        The data source is scanned once, in its own order, so every index preserves the ordering
+        that an equivalent query would have returned.
+        """
+        # stix_type => [objects]
+        self._by_type = {}
+        # stix_id => latest version of the object
+        self._by_id = {}
+        # (stix_type, external_id) => first object with that external ID
+        self._by_external_id = {}
+        # (stix_type, name) => [objects]
+        self._by_name = {}
+        # (source_type, relationship_type, target_type) => [relationships]
+        self._rels_by_types = {}
+        # stix_id => [relationships] with the object as source or target
+        self._rels_by_source = {}
+        self._rels_by_target = {}
+
+        for obj in self.src.query():
+            stix_type = obj["type"]
+            stix_id = obj["id"]
+            self._by_type.setdefault(stix_type, []).append(obj)
+
+            # mirror self.src.get(), which returns the most recently modified version
+            if stix_id not in self._by_id or self._by_id[stix_id].get("modified", "") < obj.get("modified", ""):
+                self._by_id[stix_id] = obj
+
+            if stix_type == "relationship":
+                relationship_types = (
+                    get_type_from_id(obj["source_ref"]),
+                    obj["relationship_type"],
+                    get_type_from_id(obj["target_ref"]),
+                )
+                self._rels_by_types.setdefault(relationship_types, []).append(obj)
+                self._rels_by_source.setdefault(obj["source_ref"], []).append(obj)
+                self._rels_by_target.setdefault(obj["target_ref"], []).append(obj)
+                continue
+
+            for external_reference in obj.get("external_references", []):
+                external_id = external_reference.get("external_id")
+                if external_id:
+                    self._by_external_id.setdefault((stix_type, external_id), obj)
+
+            name = obj.get("name")
+            if name is not None:
+                self._by_name.setdefault((stix_type, name), []).append(obj)
+
+    def _stix_object(self, data: dict) -> object:
+        """Convert an object from the data source with StixObjectFactory, reusing previously built objects.
+
+        Building the ATT&CK custom objects validates every property, and the objects are immutable, so each
+        object only needs to be built once.
+
+        Parameters
+        ----------
+        data : dict
+            the object from the data source
+
+        Returns
+        -------
+        stix2.CustomObject | stix2.v20.sdo._DomainObject
+            the object built by StixObjectFactory
+        """
+        cached = self._stix_objects.get(data["id"])
+        if cached and cached[0] is data:
+            return cached[1]
+
+        stix_object = StixObjectFactory(data)
+        if stix_object is not data:
+            self._stix_objects[data["id"]] = (data, stix_object)
+        return stix_object
+
+    def _query_by_type(self, stix_type: str) -> list:
+        """Retrieve all objects of a STIX type from the type index.
+
+        Parameters
+        ----------
+        stix_type : str
+            the STIX type of the objects to retrieve
+
+        Returns
+        -------
+        list
+            a list of objects of the given type. This list is shared between callers and must not be modified.
+        """
+        return self._by_type.get(stix_type, [])
+
+    def _get_objects(self, stix_type: str, remove_revoked_deprecated=False) -> list:
+        """Retrieve a copy of the objects of a STIX type, optionally removing revoked or deprecated objects.
+
+        Parameters
+        ----------
+        stix_type : str
+            the STIX type of the objects to retrieve
+        remove_revoked_deprecated : bool, optional
+            remove revoked or deprecated objects, by default False
+
+        Returns
+        -------
+        list
+            a new list of objects of the given type, which callers are free to modify
+        """
+        objects = self._query_by_type(stix_type)
+        if remove_revoked_deprecated:
+            # filtering already produces a new list, so only one pass over the type index is needed
+            return self.remove_revoked_deprecated(objects)
+        return list(objects)
+
+    def _get_active_objects(self, stix_type: str) -> dict:
+        """Map the STIX IDs of the objects of a type that are neither revoked nor deprecated to the objects.
+
+        The mapping is built once per type, so the revoked/deprecated filter is not reapplied by every lookup.
+
+        Parameters
+        ----------
+        stix_type : str
+            the STIX object type
+
+        Returns
+        -------
+        dict
+            a mapping of stix_id => object
+        """
+        if stix_type not in self._active_objects:
+            targets = self._get_objects(stix_type, remove_revoked_deprecated=True)
+            self._active_objects[stix_type] = {target["id"]: target for target in targets}
+        return self._active_objects[stix_type]
+
+    def _query_techniques(self, filters: list) -> list:
+        """Query the techniques in the type index, rather than the entire data source.
+
+        Parameters
+        ----------
+        filters : list
+            a list of stix2 Filters to apply to the techniques
+
+        Returns
+        -------
+        list
+            a list of AttackPattern objects matching all of the filters
+        """
+        return list(apply_common_filters(self._query_by_type("attack-pattern"), filters))
+
+    def _query_by_alias(self, stix_type: str, alias_property: str, alias: str) -> list:
+        """Retrieve objects of a STIX type which have an alias containing the given string.
+
+        This matches the behavior of a stix2 `Filter(alias_property, "contains", alias)` query, which checks
+        whether the string is contained in any of the object's aliases.
+
+        Parameters
+        ----------
+        stix_type : str
+            the STIX type of the objects to retrieve
+        alias_property : str
+            the property holding the object's aliases, e.g. 'aliases' or 'x_mitre_aliases'
+        alias : str
+            the alias to search for
+
+        Returns
+        -------
+        list
+            a list of objects of the given type matching the alias
+        """
+        return [
+            obj
+            for obj in self._query_by_type(stix_type)
+            if any(alias in object_alias for object_alias in obj.get(alias_property, []))
+        ]
+
     ###################################
     # STIX Objects Section
     ###################################
@@ -121,11 +332,7 @@ class MitreAttackData:
         """
         # Note we use .get() because the property may not be present in the JSON data. The default is False
         # if the property is not set.
-        return list(
-            filter(
-                lambda x: x.get("x_mitre_deprecated", False) is False and x.get("revoked", False) is False, stix_objects
-            )
-        )
+        return [x for x in stix_objects if not x.get("revoked", False) and not x.get("x_mitre_deprecated", False)]
 
     def get_matrices(self, remove_revoked_deprecated=False) -> list:
         """Retrieve all matrix objects.
@@ -172,15 +379,10 @@ class MitreAttackData:
         list
             a list of AttackPattern objects
         """
-        filters = [Filter("type", "=", "attack-pattern")]
+        techniques = self._get_objects("attack-pattern", remove_revoked_deprecated)
         if not include_subtechniques:
             # filter out sub-techniques
-            filters.append(Filter("x_mitre_is_subtechnique", "=", False))
-
-        techniques = self.src.query(filters)
-
-        if remove_revoked_deprecated:
-            techniques = self.remove_revoked_deprecated(techniques)
+            techniques = [t for t in techniques if t.get("x_mitre_is_subtechnique") is False]
 
         return techniques
 
@@ -197,14 +399,8 @@ class MitreAttackData:
         list
             a list of AttackPattern objects
         """
-        subtechniques = self.src.query(
-            [Filter("type", "=", "attack-pattern"), Filter("x_mitre_is_subtechnique", "=", True)]
-        )
-
-        if remove_revoked_deprecated:
-            subtechniques = self.remove_revoked_deprecated(subtechniques)
-
-        return subtechniques
+        techniques = self._get_objects("attack-pattern", remove_revoked_deprecated)
+        return [t for t in techniques if t.get("x_mitre_is_subtechnique") is True]
 
     def get_mitigations(self, remove_revoked_deprecated=False) -> list:
         """Retrieve all mitigation objects.
@@ -249,9 +445,8 @@ class MitreAttackData:
         list
             a list of Tool and Malware objects
         """
-        software = self.get_objects_by_type("tool", remove_revoked_deprecated)
-        malware = self.get_objects_by_type("malware", remove_revoked_deprecated)
-        software.extend(malware)
+        software = self._get_objects("tool", remove_revoked_deprecated)
+        software.extend(self._get_objects("malware", remove_revoked_deprecated))
         return software
 
     def get_campaigns(self, remove_revoked_deprecated=False) -> list:
@@ -333,16 +528,13 @@ class MitreAttackData:
         list
             a list of stix2.v20.sdo._DomainObject or CustomStixObject objects
         """
-        objects = self.src.query([Filter("type", "=", stix_type)])
-
-        if remove_revoked_deprecated:
-            objects = self.remove_revoked_deprecated(objects)
+        objects = self._get_objects(stix_type, remove_revoked_deprecated)
 
         if not objects:
             return []
 
         # since ATT&CK has custom objects, we need to reconstruct the query results
-        return [StixObjectFactory(o) for o in objects]
+        return [self._stix_object(o) for o in objects]
 
     def get_objects_by_content(self, content: str, object_type: str = None, remove_revoked_deprecated=False) -> list:
         """Retrieve objects by the content of their description.
@@ -363,16 +555,19 @@ class MitreAttackData:
         list
             a list of objects where the given content string appears in the description
         """
-        objects = self.src
         if object_type:
             if object_type not in self.stix_types:
                 # invalid object type
-                raise ValueError(f"object_type must be one of {self.stix_types}")
+                raise ValueError(f"object_type must be one of {sorted(self.stix_types)}")
             else:
                 # filter for objects of given type
-                objects = self.src.query([Filter("type", "=", object_type)])
+                objects = self._query_by_type(object_type)
+        else:
+            objects = self.src.query()
 
-        objects = list(filter(lambda t: content.lower() in t.description.lower(), objects))
+        # not every object has a description, e.g. identities and marking definitions
+        content = content.lower()
+        objects = [o for o in objects if o.get("description") and content in o["description"].lower()]
         if remove_revoked_deprecated:
             objects = self.remove_revoked_deprecated(objects)
         return objects
@@ -392,8 +587,7 @@ class MitreAttackData:
         list
             a list of AttackPattern objects under the given platform
         """
-        filters = [Filter("type", "=", "attack-pattern"), Filter("x_mitre_platforms", "contains", platform)]
-        techniques = self.src.query(filters)
+        techniques = self._query_techniques([Filter("x_mitre_platforms", "contains", platform)])
         if remove_revoked_deprecated:
             techniques = self.remove_revoked_deprecated(techniques)
         return techniques
@@ -416,18 +610,13 @@ class MitreAttackData:
             a list of AttackPattern objects under the given tactic
         """
         # validate domain input
-        domain_to_kill_chain = {
-            "enterprise-attack": "mitre-attack",
-            "mobile-attack": "mitre-mobile-attack",
-            "ics-attack": "mitre-ics-attack",
-        }
+        domain_to_kill_chain = self.domain_to_kill_chain
         if domain not in domain_to_kill_chain.keys():
             raise ValueError(f"domain must be one of {domain_to_kill_chain.keys()}")
 
         # query techniques by tactic/domain; kill_chain_name differs by domain
-        techniques = self.src.query(
+        techniques = self._query_techniques(
             [
-                Filter("type", "=", "attack-pattern"),
                 Filter("kill_chain_phases.phase_name", "=", tactic_shortname),
                 Filter("kill_chain_phases.kill_chain_name", "=", domain_to_kill_chain[domain]),
             ]
@@ -446,18 +635,10 @@ class MitreAttackData:
         dict
             a mapping of tactics to matrices {matrix_name: [Tactics]}
         """
-        tactics = {}
-        matrices = self.src.query(
-            [
-                Filter("type", "=", "x-mitre-matrix"),
-            ]
-        )
-        for i in range(len(matrices)):
-            tactics[matrices[i]["name"]] = []
-            for tactic_id in matrices[i]["tactic_refs"]:
-                tactics[matrices[i]["name"]].append(self.src.get(tactic_id))
-
-        return tactics
+        return {
+            matrix["name"]: [self._by_id.get(tactic_id) for tactic_id in matrix["tactic_refs"]]
+            for matrix in self._query_by_type("x-mitre-matrix")
+        }
 
     def get_tactics_by_technique(self, stix_id) -> list:
         """Retrieve the list of tactics within a particular technique.
@@ -550,25 +731,22 @@ class MitreAttackData:
             a list of AttackPattern objects used by the group's software.
         """
         # get the malware, tools that the group uses
-        group_uses = [
-            r
-            for r in self.src.relationships(group_stix_id, "uses", source_only=True)
-            if get_type_from_id(r.target_ref) in ["malware", "tool"]
-        ]
+        software_ids = {
+            r.target_ref
+            for r in self._rels_by_source.get(group_stix_id, [])
+            if r.relationship_type == "uses" and get_type_from_id(r.target_ref) in ["malware", "tool"]
+        }
 
         # get the technique stix ids that the malware, tools use
-        source_refs = [r.target_ref for r in group_uses]
-        software_uses = self.src.query(
-            [
-                Filter("type", "=", "relationship"),
-                Filter("relationship_type", "=", "uses"),
-                Filter("source_ref", "in", source_refs),
-            ]
-        )
+        technique_ids = {
+            r.target_ref
+            for software_id in software_ids
+            for r in self._rels_by_source.get(software_id, [])
+            if r.relationship_type == "uses"
+        }
 
         # get the techniques themselves
-        technique_ids = [r.target_ref for r in software_uses]
-        return self.src.query([Filter("type", "=", "attack-pattern"), Filter("id", "in", technique_ids)])
+        return [t for t in self._query_by_type("attack-pattern") if t["id"] in technique_ids]
 
     ###################################
     # Get STIX Object by Value
@@ -587,12 +765,12 @@ class MitreAttackData:
         stix2.v20.sdo._DomainObject | CustomStixObject
             the STIX Domain Object specified by the STIX ID
         """
-        sdo = self.src.get(stix_id)
+        sdo = self._by_id.get(stix_id)
 
         if not sdo:
             raise ValueError(f"{stix_id} not found")
 
-        return StixObjectFactory(sdo)
+        return self._stix_object(sdo)
 
     def get_object_by_attack_id(self, attack_id: str, stix_type: str) -> object:
         """Retrieve a single object by its ATT&CK ID.
@@ -618,19 +796,14 @@ class MitreAttackData:
         """
         # validate type
         if stix_type not in self.stix_types:
-            raise ValueError(f"stix_type must be one of {self.stix_types}")
+            raise ValueError(f"stix_type must be one of {sorted(self.stix_types)}")
 
-        sdo = self.src.query(
-            [
-                Filter("external_references.external_id", "=", attack_id.upper()),
-                Filter("type", "=", stix_type),
-            ]
-        )
+        sdo = self._by_external_id.get((stix_type, attack_id.upper()))
 
         if not sdo:
             return None
 
-        return StixObjectFactory(sdo[0])
+        return self._stix_object(sdo)
 
     def get_objects_by_name(self, name: str, stix_type: str) -> list:
         """Retrieve objects by name.
@@ -653,16 +826,15 @@ class MitreAttackData:
         """
         # validate type
         if stix_type not in self.stix_types:
-            raise ValueError(f"stix_type must be one of {self.stix_types}")
+            raise ValueError(f"stix_type must be one of {sorted(self.stix_types)}")
 
-        filters = [Filter("type", "=", stix_type), Filter("name", "=", name)]
-        objects = self.src.query(filters)
+        objects = self._by_name.get((stix_type, name))
 
         if not objects:
             return []
 
         # since ATT&CK has custom objects, we need to reconstruct the query results
-        return [StixObjectFactory(o) for o in objects]
+        return [self._stix_object(o) for o in objects]
 
     def get_groups_by_alias(self, alias: str) -> list:
         """Retrieve the groups corresponding to a given alias.
@@ -679,8 +851,7 @@ class MitreAttackData:
         list
             a list of stix2.v20.sdo.IntrusionSet objects corresponding to the alias
         """
-        filters = [Filter("type", "=", "intrusion-set"), Filter("aliases", "contains", alias)]
-        return self.src.query(filters)
+        return self._query_by_alias("intrusion-set", "aliases", alias)
 
     def get_campaigns_by_alias(self, alias: str) -> list:
         """Retrieve the campaigns corresponding to a given alias.
@@ -697,8 +868,7 @@ class MitreAttackData:
         list
             a list of stix2.v20.sdo.Campaign objects corresponding to the alias
         """
-        filters = [Filter("type", "=", "campaign"), Filter("aliases", "contains", alias)]
-        return self.src.query(filters)
+        return self._query_by_alias("campaign", "aliases", alias)
 
     def get_software_by_alias(self, alias: str) -> list:
         """Retrieve the software corresponding to a given alias.
@@ -715,10 +885,9 @@ class MitreAttackData:
         list
             a list of stix2.v20.sdo.Tool and stix2.v20.sdo.Malware objects corresponding to the alias
         """
-        malware_filter = [Filter("type", "=", "malware"), Filter("x_mitre_aliases", "contains", alias)]
-        tool_filter = [Filter("type", "=", "tool"), Filter("x_mitre_aliases", "contains", alias)]
-        software = list(chain.from_iterable(self.src.query(f) for f in [malware_filter, tool_filter]))
-        return software
+        malware = self._query_by_alias("malware", "x_mitre_aliases", alias)
+        tools = self._query_by_alias("tool", "x_mitre_aliases", alias)
+        return malware + tools
 
     ###################################
     # Get Object Information
@@ -737,11 +906,15 @@ class MitreAttackData:
         str
             the ATT&CK ID of the object
         """
-        obj = self.get_object_by_stix_id(stix_id)
+        # read the object directly; reconstructing a custom object is not needed to read its references
+        obj = self._by_id.get(stix_id)
+        if not obj:
+            raise ValueError(f"{stix_id} not found")
+
         external_references = obj.get("external_references")
         if external_references:
             attack_source = external_references[0]
-            if attack_source.get("external_id") and attack_source.get("source_name") == "mitre-attack":
+            if attack_source.get("source_name") == "mitre-attack" and attack_source.get("external_id"):
                 return attack_source["external_id"]
         return None
 
@@ -773,16 +946,61 @@ class MitreAttackData:
         str
             the name of the object
         """
-        obj = self.get_object_by_stix_id(stix_id)
+        obj = self._by_id.get(stix_id)
+        if not obj:
+            raise ValueError(f"{stix_id} not found")
+
         return obj.get("name") if obj.get("name") else None
 
     ###################################
     # Relationship Section
     ###################################
 
+    def _get_relationship_maps(self, source_type: str, relationship_type: str, target_type: str) -> tuple:
+        """Map objects to the objects they are related to, in both directions, caching the result.
+
+        Both mappings are built in the same pass over the relationships, so building the reverse mapping of
+        a relationship that has already been mapped is free. The related objects of each object are stored as a
+        `_RelatedRefs` record rather than as a list of small dictionaries.
+
+        Parameters
+        ----------
+        source_type : str
+            source type for the relationships, e.g. 'intrusion-set'
+        relationship_type : str
+            relationship type for the relationships, e.g. 'uses'
+        target_type : str
+            target type for the relationships, e.g. 'attack-pattern'
+
+        Returns
+        -------
+        tuple
+            (source_object_id => _RelatedRefs(target_object_ids, relationships), target_object_id => _RelatedRefs(source_object_ids, relationships))
+        """
+        key = (source_type, relationship_type, target_type)
+        if key in self._relationship_maps:
+            return self._relationship_maps[key]
+
+        forward, backward = defaultdict(lambda: _RelatedRefs([], [])), defaultdict(lambda: _RelatedRefs([], []))
+        for relationship in self.remove_revoked_deprecated(self._rels_by_types.get(key, [])):
+            source_ref, target_ref = relationship.source_ref, relationship.target_ref
+            targets = forward[source_ref]
+            targets.ids.append(target_ref)
+            targets.relationships.append(relationship)
+            sources = backward[target_ref]
+            sources.ids.append(source_ref)
+            sources.relationships.append(relationship)
+
+        # plain dicts so that later lookups of unrelated objects do not add empty entries
+        self._relationship_maps[key] = (dict(forward), dict(backward))
+        return self._relationship_maps[key]
+
     def get_related(self, source_type: str, relationship_type: str, target_type: str, reverse: bool = False) -> dict:
         """Build relationship mappings.
 
+        Mappings are built once and cached, so every call with the same arguments returns the same dictionary,
+        which is also shared with the `get_all_*()` methods built from it. Copy a mapping before modifying it.
+
         Parameters
         ----------
         source_type : str
@@ -800,74 +1018,83 @@ class MitreAttackData:
             if reverse=False, relationship mapping of source_object_id => [{target_object, relationship[]}];
             if reverse=True, relationship mapping of target_object_id => [{source_object, relationship[]}]
         """
-        relationships = self.src.query(
-            [
-                Filter("type", "=", "relationship"),
-                Filter("relationship_type", "=", relationship_type),
-                Filter("revoked", "=", False),
-            ]
-        )
-        relationships = self.remove_revoked_deprecated(relationships)
-
-        # stix_id => [ { relationship, related_object_id } for each related object ]
-        id_to_related = {}
-
-        # build the dict
-        for relationship in relationships:
-            if source_type in relationship.source_ref and target_type in relationship.target_ref:
-                if (relationship.source_ref in id_to_related and not reverse) or (
-                    relationship.target_ref in id_to_related and reverse
-                ):
-                    # append to existing entry
-                    if not reverse:
-                        id_to_related[relationship.source_ref].append(
-                            {"relationship": relationship, "id": relationship.target_ref}
-                        )
-                    else:
-                        id_to_related[relationship.target_ref].append(
-                            {"relationship": relationship, "id": relationship.source_ref}
-                        )
-                else:
-                    # create a new entry
-                    if not reverse:
-                        id_to_related[relationship.source_ref] = [
-                            {"relationship": relationship, "id": relationship.target_ref}
-                        ]
-                    else:
-                        id_to_related[relationship.target_ref] = [
-                            {"relationship": relationship, "id": relationship.source_ref}
-                        ]
-
-        # all objects of relevant type
-        if not reverse:
-            targets = self.src.query([Filter("type", "=", target_type)])
-        else:
-            targets = self.src.query([Filter("type", "=", source_type)])
+        # return data if it has already been built
+        key = (source_type, relationship_type, target_type, reverse)
+        if key in self._related_cache:
+            return self._related_cache[key]
 
-        # remove revoked/deprecated objects
-        targets = self.remove_revoked_deprecated(targets)
+        # stix_id => _RelatedRefs([related_object_id], [relationship]) of the related objects
+        forward, backward = self._get_relationship_maps(source_type, relationship_type, target_type)
+        id_to_related = backward if reverse else forward
 
-        # build lookup of stixID to stix object
-        id_to_target = {}
-        for target in targets:
-            id_to_target[target["id"]] = target
+        # lookup of stixID to stix object for all objects of relevant type, without revoked/deprecated objects
+        id_to_target = self._get_active_objects(source_type if reverse else target_type)
 
         # build final output mappings
+        factory = self._stix_object
         output = {}
-        for stix_id in id_to_related:
-            value = []
-            for related in id_to_related[stix_id]:
-                if related["id"] not in id_to_target:
-                    continue  # targeting a revoked object
-                value.append(
-                    {
-                        "object": StixObjectFactory(id_to_target[related["id"]]),
-                        "relationships": [related["relationship"]],
-                    }
-                )
-            output[stix_id] = value
+        for stix_id, related in id_to_related.items():
+            output[stix_id] = [
+                {"object": factory(id_to_target[related_id]), "relationships": [relationship]}
+                for related_id, relationship in zip(related.ids, related.relationships)
+                if related_id in id_to_target  # skip relationships targeting a revoked object
+            ]
+
+        self._related_cache[key] = output
         return output
 
+    def _get_related_to(
+        self, stix_id: str, source_type: str, relationship_type: str, target_type: str, reverse: bool = False
+    ) -> list:
+        """Build the relationship mapping entry of a single object.
+
+        This returns the same list as `get_related(source_type, relationship_type, target_type, reverse)[stix_id]`,
+        but only walks the relationships of the given object instead of building the mapping for every object.
+
+        Parameters
+        ----------
+        stix_id : str
+            the STIX ID of the object, a source object if reverse=False or a target object if reverse=True
+        source_type : str
+            source type for the relationships, e.g. 'intrusion-set'
+        relationship_type : str
+            relationship type for the relationships, e.g. 'uses'
+        target_type : str
+            target type for the relationships, e.g. 'attack-pattern'
+        reverse : bool, optional
+            find the sources targeting the object instead of the targets of the object, by default False
+
+        Returns
+        -------
+        list
+            a list of {"object": object, "relationships": [relationship]} for each related object
+        """
+        if reverse:
+            relationships = self._rels_by_target.get(stix_id, [])
+            related_ref, related_type, object_prefix = "source_ref", source_type, f"{target_type}--"
+        else:
+            relationships = self._rels_by_source.get(stix_id, [])
+            related_ref, related_type, object_prefix = "target_ref", target_type, f"{source_type}--"
+
+        if not stix_id.startswith(object_prefix):
+            return []
+
+        related_prefix = f"{related_type}--"
+        # resolve related objects the same way get_related() does
+        id_to_related = self._get_active_objects(related_type)
+        related = []
+        for relationship in self.remove_revoked_deprecated(relationships):
+            if relationship.relationship_type != relationship_type:
+                continue
+            related_id = relationship[related_ref]
+            if not related_id.startswith(related_prefix):
+                continue
+            related_object = id_to_related.get(related_id)
+            if not related_object:
+                continue  # targeting a missing or revoked object
+            related.append({"object": self._stix_object(related_object), "relationships": [relationship]})
+        return related
+
     def merge(self, map_a: dict, map_b: dict) -> dict:
         """Merge two relationship mappings resulting from `get_related()`.
 
@@ -883,12 +1110,27 @@ class MitreAttackData:
         dict
             the merged relationship mapping
         """
-        for id in map_b:
-            if id in map_a:
-                map_a[id].extend(map_b[id])
-            else:
-                map_a[id] = map_b[id]
-        return map_a
+        return self.merge_many(map_a, map_b)
+
+    def merge_many(self, *maps: dict) -> dict:
+        """Merge any number of relationship mappings resulting from `get_related()`.
+
+        Parameters
+        ----------
+        *maps : dict
+            the relationship mappings, the related objects of a STIX ID are concatenated in the given order
+
+        Returns
+        -------
+        dict
+            the merged relationship mapping
+        """
+        # build a new mapping, the input mappings may be cached by `get_related()`
+        merged = defaultdict(list)
+        for relationship_map in maps:
+            for stix_id, related in relationship_map.items():
+                merged[stix_id] += related
+        return dict(merged)
 
     def add_inherited_campaign_relationships(
         self, related_campaigns, inherited_campaign_relationships, object_relationships
@@ -904,27 +1146,26 @@ class MitreAttackData:
         object_relationships : dict
             direct relationships with the object itself: [object_stix_id => [ {related_object, [relationship]} ]]
         """
+        # copy the lists before appending to them, the input mapping may be cached by `get_related()`
+        object_relationships = defaultdict(
+            list, {stix_id: list(related) for stix_id, related in object_relationships.items()}
+        )
         for stix_id, campaigns in related_campaigns.items():
-            for campaign in campaigns:
-                if campaign["object"]["id"] not in inherited_campaign_relationships:
-                    # no relationships inherited from campaign
-                    continue
-
-                # inheriting relationships from campaign
-                for stix_object in inherited_campaign_relationships[campaign["object"]["id"]]:
-                    # append inherited campaign relationship and campaign/group relationship
-                    relationship = {
-                        "object": stix_object["object"],
-                        "relationships": stix_object["relationships"] + campaign["relationships"],
-                    }
-
-                    if stix_id not in object_relationships:
-                        # add inherited relationship entry from attributed campaign
-                        object_relationships[stix_id] = [relationship]
-                        continue
-
-                    # object exists, add inherited campaign relationships to existing list
-                    object_relationships[stix_id].append(relationship)
+            # inheriting relationships from campaigns, appending the campaign/object relationship to each of them
+            inherited = list(
+                chain.from_iterable(
+                    (
+                        {
+                            "object": stix_object["object"],
+                            "relationships": stix_object["relationships"] + campaign["relationships"],
+                        }
+                        for stix_object in inherited_campaign_relationships.get(campaign["object"]["id"], ())
+                    )
+                    for campaign in campaigns
+                )
+            )
+            if inherited:
+                object_relationships[stix_id].extend(inherited)
 
         # remove duplicates
         object_relationships = self.remove_duplicates(object_relationships)
@@ -932,22 +1173,46 @@ class MitreAttackData:
 
     def remove_duplicates(self, relationship_map) -> dict:
         """Remove duplicate objects in a list of [{"object": object, "relationships": [relationship]}]."""
-        deduplicated_map = {}  # {stix_id => [{"object": object, "relationships": []}]}
-        for stix_id, sdos in relationship_map.items():
-            sdo_list = []
-            seen_sdo_ids = []
-            for sdo in sdos:
-                if sdo["object"]["id"] not in seen_sdo_ids:
-                    seen_sdo_ids.append(sdo["object"]["id"])
-                    sdo_list.append(sdo)
-                    continue
-
-                # seen this object before, append relationships
-                for index, item in enumerate(sdo_list):
-                    if item["object"].id == sdo["object"].id:
-                        sdo_list[index]["relationships"] = item["relationships"] + sdo["relationships"]
-            deduplicated_map[stix_id] = sdo_list
-        return deduplicated_map
+        # {stix_id => [{"object": object, "relationships": []}]}
+        return {stix_id: self._remove_duplicates_from_list(sdos) for stix_id, sdos in relationship_map.items()}
+
+    def _remove_duplicates_from_list(self, sdos: list) -> list:
+        """Remove duplicate objects in a single list of {"object": object, "relationships": [relationship]}."""
+        sdo_list = []
+        seen_sdo_ids = {}  # {sdo_id => index in sdo_list}
+        for sdo in sdos:
+            sdo_id = sdo["object"]["id"]
+            if sdo_id not in seen_sdo_ids:
+                seen_sdo_ids[sdo_id] = len(sdo_list)
+                sdo_list.append(sdo)
+                continue
+
+            # seen this object before, append relationships to a new entry rather than the shared one
+            index = seen_sdo_ids[sdo_id]
+            item = sdo_list[index]
+            sdo_list[index] = {"object": item["object"], "relationships": item["relationships"] + sdo["relationships"]}
+        return sdo_list
+
+    def select_by_ids(self, relationship_map: dict, stix_ids: Iterable[str]) -> dict:
+        """Select the entries of several objects from a relationship mapping.
+
+        This is the bulk counterpart of the single object methods, e.g. `get_software_used_by_group()`: the mapping
+        is built once by the matching `get_all_*()` method and each object is then a dictionary lookup.
+
+        Parameters
+        ----------
+        relationship_map : dict
+            a relationship mapping, e.g. the result of `get_all_software_used_by_all_groups()`
+        stix_ids : Iterable[str]
+            the STIX IDs of the objects to select
+
+        Returns
+        -------
+        dict
+            a mapping of stix_id => [{"object": object, "relationships": Relationship[]}] for each requested object,
+            with an empty list for objects without related objects
+        """
+        return {stix_id: relationship_map.get(stix_id, []) for stix_id in stix_ids}
 
     ###################################
     # Software/Group Relationships
@@ -963,7 +1228,7 @@ class MitreAttackData:
             by campaigns attributed to the group
         """
         # return data if it has already been fetched
-        if self.all_software_used_by_all_groups:
+        if self.all_software_used_by_all_groups is not None:
             return self.all_software_used_by_all_groups
 
         # get software used by groups: [group_id => [ {software, [group_uses_software]} ]]
@@ -972,12 +1237,10 @@ class MitreAttackData:
         software_used_by_groups = self.merge(tools_used_by_groups, malware_used_by_groups)
 
         # get software used by campaigns: [campaign_id => [ {software, [campaign_uses_software]} ]]
-        tools_used_by_campaigns = self.get_related("campaign", "uses", "tool")
-        malware_used_by_campaigns = self.get_related("campaign", "uses", "malware")
-        software_used_by_campaigns = self.merge(tools_used_by_campaigns, malware_used_by_campaigns)
+        software_used_by_campaigns = self.get_all_software_used_by_all_campaigns()
 
         # get groups attributing to campaigns: [group_id => [ {campaign, [campaign_attributed-to_group]} ]]
-        groups_attributing = self.get_related("campaign", "attributed-to", "intrusion-set", reverse=True)
+        groups_attributing = self.get_all_campaigns_attributed_to_all_groups()
 
         # add inherited relationships to software used by groups
         software_used_by_groups = self.add_inherited_campaign_relationships(
@@ -1001,8 +1264,27 @@ class MitreAttackData:
             a list of {"object": Malware|Tool, "relationships": Relationship[]} for each software used by the group and each software used
             by campaigns attributed to the group
         """
-        software_used_by_groups = self.get_all_software_used_by_all_groups()
-        return software_used_by_groups[group_stix_id] if group_stix_id in software_used_by_groups else []
+        # use the mapping of all groups if it has already been fetched
+        if self.all_software_used_by_all_groups is not None:
+            software_used_by_groups = self.all_software_used_by_all_groups
+            return software_used_by_groups.get(group_stix_id, [])
+
+        # otherwise only build the relationships of the requested group
+        software_used_by_group = self._get_related_to(group_stix_id, "intrusion-set", "uses", "tool")
+        software_used_by_group += self._get_related_to(group_stix_id, "intrusion-set", "uses", "malware")
+
+        # add the software inherited from attributed campaigns, with the campaign/group relationship appended
+        campaigns = self._get_related_to(group_stix_id, "campaign", "attributed-to", "intrusion-set", reverse=True)
+        for campaign in campaigns:
+            campaign_id = campaign["object"]["id"]
+            software_used_by_campaign = self._get_related_to(campaign_id, "campaign", "uses", "tool")
+            software_used_by_campaign += self._get_related_to(campaign_id, "campaign", "uses", "malware")
+            software_used_by_group += [
+                {"object": software["object"], "relationships": software["relationships"] + campaign["relationships"]}
+                for software in software_used_by_campaign
+            ]
+
+        return self._remove_duplicates_from_list(software_used_by_group)
 
     def get_all_groups_using_all_software(self) -> dict:
         """Get all groups using all software.
@@ -1014,7 +1296,7 @@ class MitreAttackData:
             using the software
         """
         # return data if it has already been fetched
-        if self.all_groups_using_all_software:
+        if self.all_groups_using_all_software is not None:
             return self.all_groups_using_all_software
 
         # get groups using software: [software_id => [ {group, [group_uses_software]} ]]
@@ -1023,12 +1305,10 @@ class MitreAttackData:
         groups_using_software = self.merge(groups_using_tools, groups_using_malware)
 
         # get campaigns using software: [software_id => [ {campaign, [campaign_uses_software]} ]]
-        campaigns_using_tools = self.get_related("campaign", "uses", "tool", reverse=True)
-        campaigns_using_malware = self.get_related("campaign", "uses", "malware", reverse=True)
-        campaigns_using_software = self.merge(campaigns_using_tools, campaigns_using_malware)
+        campaigns_using_software = self.get_all_campaigns_using_all_software()
 
         # get groups attributing to campaigns: [campaign_id => [ {group, [campaign_attributed-to_group]} ]]
-        attributed_campaigns = self.get_related("campaign", "attributed-to", "intrusion-set")
+        attributed_campaigns = self.get_all_groups_attributing_to_all_campaigns()
 
         # add inherited relationships to groups using software
         groups_using_software = self.add_inherited_campaign_relationships(
@@ -1053,7 +1333,7 @@ class MitreAttackData:
             using the software
         """
         groups_using_software = self.get_all_groups_using_all_software()
-        return groups_using_software[software_stix_id] if software_stix_id in groups_using_software else []
+        return groups_using_software.get(software_stix_id, [])
 
     ###################################
     # Software/Campaign Relationships
@@ -1068,7 +1348,7 @@ class MitreAttackData:
             a mapping of campaign_stix_id => [{"object": Malware|Tool, "relationships": Relationship[]}] for each software used by the campaign
         """
         # return data if it has already been fetched
-        if self.all_software_used_by_all_campaigns:
+        if self.all_software_used_by_all_campaigns is not None:
             return self.all_software_used_by_all_campaigns
 
         tools_used_by_campaigns = self.get_related("campaign", "uses", "tool")
@@ -1091,7 +1371,7 @@ class MitreAttackData:
             a list of {"object": Malware|Tool, "relationships": Relationship[]} for each software used by the campaign
         """
         software_used_by_campaigns = self.get_all_software_used_by_all_campaigns()
-        return software_used_by_campaigns[campaign_stix_id] if campaign_stix_id in software_used_by_campaigns else []
+        return software_used_by_campaigns.get(campaign_stix_id, [])
 
     def get_all_campaigns_using_all_software(self) -> dict:
         """Get all campaigns using all software.
@@ -1102,7 +1382,7 @@ class MitreAttackData:
             a mapping of software_stix_id => [{"object": Campaign, "relationships": Relationship[]}] for each campaign using the software
         """
         # return data if it has already been fetched
-        if self.all_campaigns_using_all_software:
+        if self.all_campaigns_using_all_software is not None:
             return self.all_campaigns_using_all_software
 
         campaigns_using_tools = self.get_related("campaign", "uses", "tool", reverse=True)
@@ -1125,7 +1405,7 @@ class MitreAttackData:
             a list of {"object": Campaign, "relationships": Relationship[]} for each campaign using the software
         """
         campaigns_using_software = self.get_all_campaigns_using_all_software()
-        return campaigns_using_software[software_stix_id] if software_stix_id in campaigns_using_software else []
+        return campaigns_using_software.get(software_stix_id, [])
 
     ###################################
     # Campaign/Group Relationships
@@ -1140,7 +1420,7 @@ class MitreAttackData:
             a mapping of campaign_stix_id => [{"object": IntrusionSet, "relationships: Relationship[]}] for each group attributing to the campaign
         """
         # return data if it has already been fetched
-        if self.all_groups_attributing_to_all_campaigns:
+        if self.all_groups_attributing_to_all_campaigns is not None:
             return self.all_groups_attributing_to_all_campaigns
 
         self.all_groups_attributing_to_all_campaigns = self.get_related("campaign", "attributed-to", "intrusion-set")
@@ -1161,11 +1441,7 @@ class MitreAttackData:
             a list of {"object": IntrusionSet, "relationships": Relationship[]} for each group attributing to the campaign
         """
         groups_attributing_to_campaigns = self.get_all_groups_attributing_to_all_campaigns()
-        return (
-            groups_attributing_to_campaigns[campaign_stix_id]
-            if campaign_stix_id in groups_attributing_to_campaigns
-            else []
-        )
+        return groups_attributing_to_campaigns.get(campaign_stix_id, [])
 
     def get_all_campaigns_attributed_to_all_groups(self) -> dict:
         """Get all campaigns attributed to all groups.
@@ -1176,7 +1452,7 @@ class MitreAttackData:
             a mapping of group_stix_id => [{"object": Campaign, "relationships": Relationship[]}] for each campaign attributed to the group
         """
         # return data if it has already been fetched
-        if self.all_campaigns_attributed_to_all_groups:
+        if self.all_campaigns_attributed_to_all_groups is not None:
             return self.all_campaigns_attributed_to_all_groups
 
         self.all_campaigns_attributed_to_all_groups = self.get_related(
@@ -1199,7 +1475,7 @@ class MitreAttackData:
             a list of {"object": Campaign, "relationships": Relationship[]} for each campaign attributed to the group
         """
         campaigns_attributed_to_groups = self.get_all_campaigns_attributed_to_all_groups()
-        return campaigns_attributed_to_groups[group_stix_id] if group_stix_id in campaigns_attributed_to_groups else []
+        return campaigns_attributed_to_groups.get(group_stix_id, [])
 
     ###################################
     # Technique/Group Relationships
@@ -1215,17 +1491,17 @@ class MitreAttackData:
             each technique used by campaigns attributed to the group
         """
         # return data if it has already been fetched
-        if self.all_techniques_used_by_all_groups:
+        if self.all_techniques_used_by_all_groups is not None:
             return self.all_techniques_used_by_all_groups
 
         # get techniques used by groups: [group_id => [ {technique, [group_uses_technique]} ]]
         techniques_used_by_groups = self.get_related("intrusion-set", "uses", "attack-pattern")
 
         # get techniques used by campaigns: [campaign_id => [ {technique, [campaign_uses_technique]} ]]
-        techniques_used_by_campaigns = self.get_related("campaign", "uses", "attack-pattern")
+        techniques_used_by_campaigns = self.get_all_techniques_used_by_all_campaigns()
 
         # get groups attributing to campaigns: [group_id => [ {campaign, [campaign_attributed-to_group]} ]]
-        groups_attributing = self.get_related("campaign", "attributed-to", "intrusion-set", reverse=True)
+        groups_attributing = self.get_all_campaigns_attributed_to_all_groups()
 
         # add inherited relationships to techniques used by groups
         techniques_used_by_groups = self.add_inherited_campaign_relationships(
@@ -1250,7 +1526,7 @@ class MitreAttackData:
             each technique used by campaigns attributed to the group
         """
         techniques_used_by_groups = self.get_all_techniques_used_by_all_groups()
-        return techniques_used_by_groups[group_stix_id] if group_stix_id in techniques_used_by_groups else []
+        return techniques_used_by_groups.get(group_stix_id, [])
 
     def get_all_groups_using_all_techniques(self) -> dict:
         """Get all groups using all techniques.
@@ -1262,17 +1538,17 @@ class MitreAttackData:
             technique and each campaign attributed to groups using the technique
         """
         # return data if it has already been fetched
-        if self.all_groups_using_all_techniques:
+        if self.all_groups_using_all_techniques is not None:
             return self.all_groups_using_all_techniques
 
         # get groups using techniques: [technique_id => [ {group, [group_uses_technique]} ]]
         groups_using_techniques = self.get_related("intrusion-set", "uses", "attack-pattern", reverse=True)
 
         # get campaigns using techniques: [technique_id => [ {campaign, [campaign_uses_technique]} ]]
-        campaigns_using_techniques = self.get_related("campaign", "uses", "attack-pattern", reverse=True)
+        campaigns_using_techniques = self.get_all_campaigns_using_all_techniques()
 
         # get groups attributing to campaigns: [campaign_id => [ {group, [campaign_attributed-to_group]} ]]
-        attributed_campaigns = self.get_related("campaign", "attributed-to", "intrusion-set")
+        attributed_campaigns = self.get_all_groups_attributing_to_all_campaigns()
 
         # add inherited relationships to groups using techniques
         groups_using_techniques = self.add_inherited_campaign_relationships(
@@ -1297,7 +1573,7 @@ class MitreAttackData:
             groups using the technique
         """
         groups_using_techniques = self.get_all_groups_using_all_techniques()
-        return groups_using_techniques[technique_stix_id] if technique_stix_id in groups_using_techniques else []
+        return groups_using_techniques.get(technique_stix_id, [])
 
     ###################################
     # Technique/Campaign Relationships
@@ -1312,7 +1588,7 @@ class MitreAttackData:
             a mapping of campaign_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] for each technique used by the campaign
         """
         # return data if it has already been fetched
-        if self.all_techniques_used_by_all_campaigns:
+        if self.all_techniques_used_by_all_campaigns is not None:
             return self.all_techniques_used_by_all_campaigns
 
         self.all_techniques_used_by_all_campaigns = self.get_related("campaign", "uses", "attack-pattern")
@@ -1333,9 +1609,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} for each technique used by the campaign
         """
         techniques_used_by_campaigns = self.get_all_techniques_used_by_all_campaigns()
-        return (
-            techniques_used_by_campaigns[campaign_stix_id] if campaign_stix_id in techniques_used_by_campaigns else []
-        )
+        return techniques_used_by_campaigns.get(campaign_stix_id, [])
 
     def get_all_campaigns_using_all_techniques(self) -> dict:
         """Get all campaigns using all techniques.
@@ -1346,7 +1620,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{"object": Campaign, "relationships": Relationship[]}] for each campaign using the technique
         """
         # return data if it has already been fetched
-        if self.all_campaigns_using_all_techniques:
+        if self.all_campaigns_using_all_techniques is not None:
             return self.all_campaigns_using_all_techniques
 
         self.all_campaigns_using_all_techniques = self.get_related("campaign", "uses", "attack-pattern", reverse=True)
@@ -1367,7 +1641,7 @@ class MitreAttackData:
             a list of {"object": Campaign, "relationships": Relationship[]} for each campaign using the technique
         """
         campaigns_using_techniques = self.get_all_campaigns_using_all_techniques()
-        return campaigns_using_techniques[technique_stix_id] if technique_stix_id in campaigns_using_techniques else []
+        return campaigns_using_techniques.get(technique_stix_id, [])
 
     ###################################
     # Technique/Software Relationships
@@ -1382,7 +1656,7 @@ class MitreAttackData:
             a mapping of software_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] for each technique used by the software
         """
         # return data if it has already been fetched
-        if self.all_techniques_used_by_all_software:
+        if self.all_techniques_used_by_all_software is not None:
             return self.all_techniques_used_by_all_software
 
         techniques_by_tools = self.get_related("tool", "uses", "attack-pattern")
@@ -1405,7 +1679,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} for each technique used by the software
         """
         techniques_used_by_software = self.get_all_techniques_used_by_all_software()
-        return techniques_used_by_software[software_stix_id] if software_stix_id in techniques_used_by_software else []
+        return techniques_used_by_software.get(software_stix_id, [])
 
     def get_all_software_using_all_techniques(self) -> dict:
         """Get all software using all techniques.
@@ -1416,7 +1690,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{"object": Malware|Tool, "relationships": Relationship[]}] for each software using the technique
         """
         # return data if it has already been fetched
-        if self.all_software_using_all_techniques:
+        if self.all_software_using_all_techniques is not None:
             return self.all_software_using_all_techniques
 
         tools_using_techniques = self.get_related("tool", "uses", "attack-pattern", reverse=True)
@@ -1439,7 +1713,7 @@ class MitreAttackData:
             a list of {"object": Malware|Tool, "relationships": Relationship[]} for each software using the technique
         """
         software_using_techniques = self.get_all_software_using_all_techniques()
-        return software_using_techniques[technique_stix_id] if technique_stix_id in software_using_techniques else []
+        return software_using_techniques.get(technique_stix_id, [])
 
     ###################################
     # Technique/Mitigation Relationships
@@ -1454,7 +1728,7 @@ class MitreAttackData:
             a mapping of mitigation_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] for each technique mitigated by the mitigation
         """
         # return data if it has already been fetched
-        if self.all_techniques_mitigated_by_all_mitigations:
+        if self.all_techniques_mitigated_by_all_mitigations is not None:
             return self.all_techniques_mitigated_by_all_mitigations
 
         self.all_techniques_mitigated_by_all_mitigations = self.get_related(
@@ -1477,11 +1751,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} for each technique mitigated by the mitigation
         """
         techniques_mitigated_by_mitigations = self.get_all_techniques_mitigated_by_all_mitigations()
-        return (
-            techniques_mitigated_by_mitigations[mitigation_stix_id]
-            if mitigation_stix_id in techniques_mitigated_by_mitigations
-            else []
-        )
+        return techniques_mitigated_by_mitigations.get(mitigation_stix_id, [])
 
     def get_all_mitigations_mitigating_all_techniques(self) -> dict:
         """Get all mitigations mitigating all techniques.
@@ -1492,7 +1762,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{"object": CourseOfAction, "relationships": Relationship[]}] for each mitigation mitigating the technique
         """
         # return data if it has already been fetched
-        if self.all_mitigations_mitigating_all_techniques:
+        if self.all_mitigations_mitigating_all_techniques is not None:
             return self.all_mitigations_mitigating_all_techniques
 
         self.all_mitigations_mitigating_all_techniques = self.get_related(
@@ -1515,11 +1785,7 @@ class MitreAttackData:
             a list of {"object": CourseOfAction, "relationships": Relationship[]} for each mitigation mitigating the technique
         """
         mitigations_mitigating_techniques = self.get_all_mitigations_mitigating_all_techniques()
-        return (
-            mitigations_mitigating_techniques[technique_stix_id]
-            if technique_stix_id in mitigations_mitigating_techniques
-            else []
-        )
+        return mitigations_mitigating_techniques.get(technique_stix_id, [])
 
     ###################################
     # Technique/Subtechnique Relationships
@@ -1534,7 +1800,7 @@ class MitreAttackData:
             a mapping of subtechnique_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] describing the parent technique of the subtechnique
         """
         # return data if it has already been fetched
-        if self.all_parent_techniques_of_all_subtechniques:
+        if self.all_parent_techniques_of_all_subtechniques is not None:
             return self.all_parent_techniques_of_all_subtechniques
 
         self.all_parent_techniques_of_all_subtechniques = self.get_related(
@@ -1543,7 +1809,7 @@ class MitreAttackData:
 
         return self.all_parent_techniques_of_all_subtechniques
 
-    def get_parent_technique_of_subtechnique(self, subtechnique_stix_id: str) -> dict:
+    def get_parent_technique_of_subtechnique(self, subtechnique_stix_id: str) -> list:
         """Get the parent technique of a sub-technique.
 
         Parameters
@@ -1553,15 +1819,11 @@ class MitreAttackData:
 
         Returns
         -------
-        dict
-            {"object": AttackPattern, "relationships": Relationship[]} describing the parent technique of the sub-technique
+        list
+            a list of {"object": AttackPattern, "relationships": Relationship[]} describing the parent technique of the sub-technique
         """
         parent_techniques_of_subtechniques = self.get_all_parent_techniques_of_all_subtechniques()
-        return (
-            parent_techniques_of_subtechniques[subtechnique_stix_id]
-            if subtechnique_stix_id in parent_techniques_of_subtechniques
-            else []
-        )
+        return parent_techniques_of_subtechniques.get(subtechnique_stix_id, [])
 
     def get_all_subtechniques_of_all_techniques(self) -> dict:
         """Get all subtechniques of all parent techniques.
@@ -1572,7 +1834,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] for each subtechnique of the technique
         """
         # return data if it has already been fetched
-        if self.all_subtechniques_of_all_techniques:
+        if self.all_subtechniques_of_all_techniques is not None:
             return self.all_subtechniques_of_all_techniques
 
         self.all_subtechniques_of_all_techniques = self.get_related(
@@ -1595,9 +1857,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} for each subtechnique of the technique
         """
         subtechniques_of_techniques = self.get_all_subtechniques_of_all_techniques()
-        return (
-            subtechniques_of_techniques[technique_stix_id] if technique_stix_id in subtechniques_of_techniques else []
-        )
+        return subtechniques_of_techniques.get(technique_stix_id, [])
 
     ###################################
     # Technique/Data Component Relationships
@@ -1612,7 +1872,7 @@ class MitreAttackData:
             a mapping of datacomponent_stix_id => [{"object": AttackPattern, "relationships": Relationship[]}] describing the detections of the data component
         """
         # return data if it has already been fetched
-        if self.all_techniques_detected_by_all_datacomponents:
+        if self.all_techniques_detected_by_all_datacomponents is not None:
             return self.all_techniques_detected_by_all_datacomponents
 
         self.all_techniques_detected_by_all_datacomponents = self.get_related(
@@ -1635,11 +1895,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} describing the detections of the data component
         """
         techniques_detected_by_datacomponents = self.get_all_techniques_detected_by_all_datacomponents()
-        return (
-            techniques_detected_by_datacomponents[datacomponent_stix_id]
-            if datacomponent_stix_id in techniques_detected_by_datacomponents
-            else []
-        )
+        return techniques_detected_by_datacomponents.get(datacomponent_stix_id, [])
 
     def get_all_datacomponents_detecting_all_techniques(self) -> dict:
         """Get all data components detecting all techniques.
@@ -1650,7 +1906,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{"object": DataComponent, "relationships": Relationship[]}] describing the data components that can detect the technique
         """
         # return data if it has already been fetched
-        if self.all_datacomponents_detecting_all_techniques:
+        if self.all_datacomponents_detecting_all_techniques is not None:
             return self.all_datacomponents_detecting_all_techniques
 
         self.all_datacomponents_detecting_all_techniques = self.get_related(
@@ -1673,11 +1929,7 @@ class MitreAttackData:
             a list of {"object": DataComponent, "relationships": Relationship[]} describing the data components that can detect the technique
         """
         datacomponents_detecting_techniques = self.get_all_datacomponents_detecting_all_techniques()
-        return (
-            datacomponents_detecting_techniques[technique_stix_id]
-            if technique_stix_id in datacomponents_detecting_techniques
-            else []
-        )
+        return datacomponents_detecting_techniques.get(technique_stix_id, [])
 
     def get_revoking_object(self, revoked_stix_id: str = "") -> object:
         """Given the STIX ID of a revoked object, retrieve the STIX object that replaced ("revoked") it.
@@ -1692,13 +1944,36 @@ class MitreAttackData:
         object
             the object that replaced ("revoked") it
         """
-        relations = self.src.relationships(revoked_stix_id, "revoked-by", source_only=True)
-        revoked_by = self.src.query([Filter("id", "in", [r.target_ref for r in relations])])
+        return self.get_all_revoking_objects().get(revoked_stix_id)
 
-        if not revoked_by:
-            return None
+    def get_all_revoking_objects(self) -> dict:
+        """Retrieve the STIX objects that replaced ("revoked") all revoked objects.
 
-        return revoked_by[0]
+        Returns
+        -------
+        dict
+            a mapping of revoked_stix_id => the object that replaced ("revoked") it
+        """
+        # return data if it has already been fetched
+        if self.all_revoking_objects is not None:
+            return self.all_revoking_objects
+
+        # revoking_stix_id => [revoked_stix_id]
+        revoked_stix_ids = {}
+        for (_, relationship_type, _), relationships in self._rels_by_types.items():
+            if relationship_type != "revoked-by":
+                continue
+            for relationship in relationships:
+                revoked_stix_ids.setdefault(relationship.target_ref, []).append(relationship.source_ref)
+
+        # a single pass over the data source, in its order, so each revoked object is mapped to the first version
+        # of the first of its revoking objects
+        self.all_revoking_objects = {}
+        for stix_object in self.src.query():
+            for revoked_stix_id in revoked_stix_ids.get(stix_object["id"], ()):
+                self.all_revoking_objects.setdefault(revoked_stix_id, stix_object)
+
+        return self.all_revoking_objects
 
     ###################################
     # Technique/Asset Relationships
@@ -1713,7 +1988,7 @@ class MitreAttackData:
             a mapping of asset_stix_id => [{'object': AttackPattern, 'relationships': Relationship[]}] for each technique targeting the asset
         """
         # return data if it has already been fetched
-        if self.all_techniques_targeting_all_assets:
+        if self.all_techniques_targeting_all_assets is not None:
             return self.all_techniques_targeting_all_assets
 
         self.all_techniques_targeting_all_assets = self.get_related(
@@ -1736,7 +2011,7 @@ class MitreAttackData:
             a list of {"object": AttackPattern, "relationships": Relationship[]} for each technique targeting the asset
         """
         techniques_targeting_assets = self.get_all_techniques_targeting_all_assets()
-        return techniques_targeting_assets[asset_stix_id] if asset_stix_id in techniques_targeting_assets else []
+        return techniques_targeting_assets.get(asset_stix_id, [])
 
     def get_all_assets_targeted_by_all_techniques(self) -> dict:
         """Get all assets targeted by all techniques.
@@ -1747,7 +2022,7 @@ class MitreAttackData:
             a mapping of technique_stix_id => [{'object': Asset, 'relationships': Relationship[]}] for each asset targeted by the technique
         """
         # return data if it has already been fetched
-        if self.all_assets_targeted_by_all_techniques:
+        if self.all_assets_targeted_by_all_techniques is not None:
             return self.all_assets_targeted_by_all_techniques
 
         self.all_assets_targeted_by_all_techniques = self.get_related("attack-pattern", "targets", "x-mitre-asset")
@@ -1768,8 +2043,4 @@ class MitreAttackData:
             a list of {"object": Asset, "relationships": Relationship[]} for each asset targeted by the technique
         """
         assets_targeted_by_techniques = self.get_all_assets_targeted_by_all_techniques()
-        return (
-            assets_targeted_by_techniques[technique_stix_id]
-            if technique_stix_id in assets_targeted_by_techniques
-            else []
-        )
+        return assets_targeted_by_techniques.get(technique_stix_id, [])
@@ -1,3 +1,5 @@
+from stix2 import IntrusionSet, MemoryStore, Relationship, Tool
+
 from mitreattack.constants import PLATFORMS_LOOKUP
 from mitreattack.stix20 import MitreAttackData
 
@@ -58,6 +60,14 @@ class TestMitreAttackData:
     # Get STIX Objects by Value
     # TODO: Finish this section
     ###################################
+    def test_objects_by_content(self, mitre_attack_data_enterprise: MitreAttackData):
+        techniques = mitre_attack_data_enterprise.get_objects_by_content(content="LSASS", object_type="attack-pattern")
+        assert techniques
+
+        # objects of any type, including those without a description
+        objects = mitre_attack_data_enterprise.get_objects_by_content(content="LSASS")
+        assert len(objects) >= len(techniques)
+
     def test_techniques_by_platform(self, mitre_attack_data_enterprise: MitreAttackData):
         for platform in PLATFORMS_LOOKUP["enterprise-attack"]:
             if platform == "Cloud":
@@ -97,6 +107,12 @@ class TestMitreAttackData:
         groups = mitre_attack_data_enterprise.get_groups_by_alias(alias=alias)
         assert groups
 
+    def test_software_by_alias(self, mitre_attack_data_enterprise: MitreAttackData):
+        alias = "Cobalt Strike"
+        software = mitre_attack_data_enterprise.get_software_by_alias(alias=alias)
+        assert software
+        assert all(s.type in ["malware", "tool"] for s in software)
+
     ###################################
     # Get Object Information
     # TODO: Finish this section
@@ -144,6 +160,13 @@ class TestMitreAttackData:
         mitigations = mitre_attack_data_enterprise.get_all_mitigations_mitigating_all_techniques()
         assert mitigations
 
+    def test_mitigations_mitigating_technique(self, mitre_attack_data_enterprise: MitreAttackData):
+        technique = mitre_attack_data_enterprise.get_object_by_attack_id("T1003", "attack-pattern")
+        mitigations = mitre_attack_data_enterprise.get_mitigations_mitigating_technique(technique.id)
+        assert mitigations
+        assert all(m["object"].type == "course-of-action" for m in mitigations)
+        assert mitigations == mitre_attack_data_enterprise.get_all_mitigations_mitigating_all_techniques()[technique.id]
+
     def test_all_parent_techniques_of_all_subtechniques(self, mitre_attack_data_enterprise: MitreAttackData):
         techniques = mitre_attack_data_enterprise.get_all_parent_techniques_of_all_subtechniques()
         assert techniques
@@ -156,10 +179,47 @@ class TestMitreAttackData:
         software = mitre_attack_data_enterprise.get_all_software_used_by_all_groups()
         assert software
 
+    def test_software_used_by_group(self, memstore_enterprise_latest: MemoryStore):
+        # a fresh instance builds a single group, it must match the mapping of all groups
+        mitre_attack_data = MitreAttackData(src=memstore_enterprise_latest)
+        software_used_by_groups = MitreAttackData(src=memstore_enterprise_latest).get_all_software_used_by_all_groups()
+        for group in mitre_attack_data.get_groups():
+            assert mitre_attack_data.get_software_used_by_group(group.id) == software_used_by_groups.get(group.id, [])
+
+    def test_software_used_by_group_with_versions(self):
+        # the newer version of the tool comes first in the data source
+        tool_id = "tool--8d9e3a2b-1b7e-4c1a-9f4e-3b2a1c0d9e8f"
+        tool_2021 = Tool(
+            id=tool_id,
+            name="Tool",
+            labels=["tool"],
+            created="2020-01-01T00:00:00.000Z",
+            modified="2021-01-01T00:00:00.000Z",
+        )
+        tool_2020 = Tool(
+            id=tool_id,
+            name="Tool",
+            labels=["tool"],
+            created="2020-01-01T00:00:00.000Z",
+            modified="2020-01-01T00:00:00.000Z",
+        )
+        group = IntrusionSet(name="Group")
+        uses = Relationship(source_ref=group.id, relationship_type="uses", target_ref=tool_id)
+        src = MemoryStore([tool_2021, tool_2020, group, uses])
+
+        software = MitreAttackData(src=src).get_software_used_by_group(group.id)
+        assert software == MitreAttackData(src=src).get_all_software_used_by_all_groups()[group.id]
+
     def test_all_software_using_all_techniques(self, mitre_attack_data_enterprise: MitreAttackData):
         software = mitre_attack_data_enterprise.get_all_software_using_all_techniques()
         assert software
 
+    def test_software_using_technique_includes_tools_and_malware(self, mitre_attack_data_enterprise: MitreAttackData):
+        # Ingress Tool Transfer is used by both tools and malware, neither list may overwrite the other when merged
+        technique = mitre_attack_data_enterprise.get_object_by_attack_id("T1105", "attack-pattern")
+        software = mitre_attack_data_enterprise.get_software_using_technique(technique.id)
+        assert {s["object"].type for s in software} == {"malware", "tool"}
+
     def test_all_subtechniques_of_all_techniques(self, mitre_attack_data_enterprise: MitreAttackData):
         subtechniques = mitre_attack_data_enterprise.get_all_subtechniques_of_all_techniques()
         assert subtechniques
@@ -183,3 +243,26 @@ class TestMitreAttackData:
     def test_all_techniques_used_by_all_software(self, mitre_attack_data_enterprise: MitreAttackData):
         techniques = mitre_attack_data_enterprise.get_all_techniques_used_by_all_software()
         assert techniques
+
+    def test_all_revoking_objects(self, mitre_attack_data_enterprise: MitreAttackData):
+        revoking_objects = mitre_attack_data_enterprise.get_all_revoking_objects()
+        assert revoking_objects
+        revoked_stix_id, revoking_object = next(iter(revoking_objects.items()))
+        assert mitre_attack_data_enterprise.get_revoking_object(revoked_stix_id) == revoking_object
+        # the mapping is built once and reused by later lookups
+        assert mitre_attack_data_enterprise.get_all_revoking_objects() is revoking_objects
+
+    def test_merge_many(self, mitre_attack_data_enterprise: MitreAttackData):
+        techniques_by_tools = mitre_attack_data_enterprise.get_related("tool", "uses", "attack-pattern")
+        techniques_by_malware = mitre_attack_data_enterprise.get_related("malware", "uses", "attack-pattern")
+        merged = mitre_attack_data_enterprise.merge_many(techniques_by_tools, techniques_by_malware)
+        assert merged == mitre_attack_data_enterprise.get_all_techniques_used_by_all_software()
+        assert mitre_attack_data_enterprise.merge_many() == {}
+
+    def test_select_by_ids(self, mitre_attack_data_enterprise: MitreAttackData):
+        software_used_by_groups = mitre_attack_data_enterprise.get_all_software_used_by_all_groups()
+        group_stix_ids = list(software_used_by_groups)[:2] + ["intrusion-set--00000000-0000-4000-8000-000000000000"]
+        software = mitre_attack_data_enterprise.select_by_ids(software_used_by_groups, group_stix_ids)
+        assert list(software) == group_stix_ids
+        assert software[group_stix_ids[0]] == mitre_attack_data_enterprise.get_software_used_by_group(group_stix_ids[0])
+        assert software[group_stix_ids[-1]] == []